@@ -2,6 +2,26 @@ import requests
 from bs4 import BeautifulSoup
 import csv
 import re
+import sys
+import time
+import json
+import cProfile
+import pstats
+import tracemalloc
+
+# Phases timed for each source, in the order they run
+SCRAPE_PHASES = ['fetch', 'parse', 'extract']
+
+# Seconds to wait for a site before giving up on it
+REQUEST_TIMEOUT = 10
+
+# Function to create an empty timing record for one source
+def new_source_stats():
+    stats = {phase: 0.0 for phase in SCRAPE_PHASES}
+    stats['bytes'] = 0
+    stats['records'] = 0
+    stats['error'] = None
+    return stats
 
 # Function to clean price text and extract numeric value
 def clean_price(price_text):
@@ -14,17 +34,29 @@ def clean_price(price_text):
     return 'N/A'
 
 # Function to scrape hotel data from a website
-def scrape_hotel_data(url, source_name):
+def scrape_hotel_data(url, source_name, stats=None):
     print(f"Scraping data from {source_name}...")
     
+    # Timings are recorded into the caller's dict when one is given
+    if stats is None:
+        stats = new_source_stats()
+    
     try:
-        # Send GET request
-        response = requests.get(url)
-        response.raise_for_status()
+        # Send GET request (fetch time is kept even if the request fails)
+        start = time.perf_counter()
+        try:
+            response = requests.get(url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+        finally:
+            stats['fetch'] = time.perf_counter() - start
+        stats['bytes'] = len(response.content)
         
         # Parse HTML
+        start = time.perf_counter()
         soup = BeautifulSoup(response.content, 'html.parser')
+        stats['parse'] = time.perf_counter() - start
         
+        start = time.perf_counter()
         hotels = []
         
         # Find all hotel listings - they appear to be in divs or sections
@@ -101,15 +133,80 @@ def scrape_hotel_data(url, source_name):
                 if hotel_count >= 10:  # Stop after 10 hotels from each source
                     break
         
+        stats['extract'] = time.perf_counter() - start
+        stats['records'] = len(hotels)
+        
         print(f"Found {len(hotels)} hotels from {source_name}")
         return hotels
         
     except Exception as e:
         print(f"Error scraping {source_name}: {e}")
+        stats['error'] = str(e)
         return []
 
+# Function to print the per-phase timing table
+def print_timing_report(source_stats, write_time, read_time, profiled=False):
+    print("=" * 60)
+    print("Timing Report")
+    print("=" * 60)
+    print()
+    print(f"{'Source':<15} {'Fetch':>8} {'Parse':>8} {'Extract':>8} {'KB':>8} {'Records':>8} {'Rec/s':>8}")
+    print("-" * 69)
+    
+    for source_name, stats in source_stats.items():
+        total = stats['fetch'] + stats['parse'] + stats['extract']
+        rate = stats['records'] / total if total > 0 else 0.0
+        kb = stats['bytes'] / 1024
+        
+        print(f"{source_name:<15} {stats['fetch']:>8.3f} {stats['parse']:>8.3f} {stats['extract']:>8.3f} "
+              f"{kb:>8.1f} {stats['records']:>8} {rate:>8.1f}")
+        if stats['error']:
+            print(f"{'':<15} FAILED: {stats['error']}")
+    
+    print("-" * 69)
+    write_text = f"{write_time:.3f}s" if write_time is not None else "n/a"
+    read_text = f"{read_time:.3f}s" if read_time is not None else "n/a"
+    print(f"CSV write: {write_text}   CSV read-back: {read_text}")
+    if profiled:
+        print("Note: run with --profile, timings include profiling overhead")
+    print()
+
+# Function to save the timing data as JSON
+def save_timing_report(json_filename, source_stats, write_time, read_time, total_time, profiled=False, peak_memory=None):
+    sources = {}
+    for source_name, stats in source_stats.items():
+        total = stats['fetch'] + stats['parse'] + stats['extract']
+        sources[source_name] = dict(stats)
+        sources[source_name]['total'] = total
+        sources[source_name]['records_per_second'] = stats['records'] / total if total > 0 else 0.0
+    
+    report = {
+        'sources': sources,
+        'write': write_time,
+        'read_back': read_time,
+        'total': total_time,
+        'profiled': profiled,
+    }
+    if peak_memory is not None:
+        report['peak_memory_bytes'] = peak_memory
+    
+    with open(json_filename, 'w', encoding='utf-8') as jsonfile:
+        json.dump(report, jsonfile, indent=2)
+    
+    print(f"Timing report saved to {json_filename}")
+    print()
+
 # Main function
-def main():
+def main(profile=False):
+    # Optional cProfile / tracemalloc capture (enabled with --profile)
+    profiler = None
+    if profile:
+        tracemalloc.start()
+        profiler = cProfile.Profile()
+        profiler.enable()
+    
+    run_start = time.perf_counter()
+    
     print("=" * 60)
     print("Hotel Price Data Scraper")
     print("Seasonal Period: December 20-30, 2025")
@@ -122,8 +219,9 @@ def main():
     
     # Scrape data from both websites
     all_hotels = []
-    all_hotels.extend(scrape_hotel_data(url1, "DublinStays"))
-    all_hotels.extend(scrape_hotel_data(url2, "LuxeHaven"))
+    source_stats = {'DublinStays': new_source_stats(), 'LuxeHaven': new_source_stats()}
+    all_hotels.extend(scrape_hotel_data(url1, "DublinStays", source_stats['DublinStays']))
+    all_hotels.extend(scrape_hotel_data(url2, "LuxeHaven", source_stats['LuxeHaven']))
     
     print()
     print(f"Total hotels scraped: {len(all_hotels)}")
@@ -131,6 +229,8 @@ def main():
     
     # Save to CSV file
     csv_filename = 'hotel_prices.csv'
+    write_time = None
+    read_time = None
     
     if all_hotels:
         print(f"Saving data to {csv_filename}...")
@@ -140,10 +240,12 @@ def main():
                      'Rating', 'Number of Reviews', 'Source']
         
         # Write to CSV
+        start = time.perf_counter()
         with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(all_hotels)
+        write_time = time.perf_counter() - start
         
         print(f"Data successfully saved to {csv_filename}")
     else:
@@ -157,31 +259,56 @@ def main():
     
     # Read and display data from CSV
     try:
+        # Only the file load is timed, not the printing below
+        start = time.perf_counter()
         with open(csv_filename, 'r', encoding='utf-8') as csvfile:
             reader = csv.DictReader(csvfile)
+            rows = list(reader)
+        # Read-back is only reported when this run wrote the file
+        if all_hotels:
+            read_time = time.perf_counter() - start
+        
+        print(f"{'No.':<5} {'Hotel Name':<35} {'Location':<25} {'Price':<10} {'Rating':<8} {'Source':<15}")
+        print("-" * 105)
+        
+        for idx, row in enumerate(rows, 1):
+            hotel_name = row['Hotel Name'][:33] + '..' if len(row['Hotel Name']) > 35 else row['Hotel Name']
+            location = row['Location'][:23] + '..' if len(row['Location']) > 25 else row['Location']
+            price = f"€{row['Price (EUR)']}"
+            rating = row['Rating']
+            source = row['Source']
             
-            print(f"{'No.':<5} {'Hotel Name':<35} {'Location':<25} {'Price':<10} {'Rating':<8} {'Source':<15}")
-            print("-" * 105)
-            
-            for idx, row in enumerate(reader, 1):
-                hotel_name = row['Hotel Name'][:33] + '..' if len(row['Hotel Name']) > 35 else row['Hotel Name']
-                location = row['Location'][:23] + '..' if len(row['Location']) > 25 else row['Location']
-                price = f"€{row['Price (EUR)']}"
-                rating = row['Rating']
-                source = row['Source']
-                
-                print(f"{idx:<5} {hotel_name:<35} {location:<25} {price:<10} {rating:<8} {source:<15}")
-            
-            print("-" * 105)
-            print()
-            
+            print(f"{idx:<5} {hotel_name:<35} {location:<25} {price:<10} {rating:<8} {source:<15}")
+        
+        print("-" * 105)
+        print()
+        
     except FileNotFoundError:
         print(f"Error: {csv_filename} not found!")
     except Exception as e:
         print(f"Error reading CSV: {e}")
     
+    total_time = time.perf_counter() - run_start
+    
+    peak_memory = None
+    if profiler:
+        profiler.disable()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    
+    print_timing_report(source_stats, write_time, read_time, profile)
+    save_timing_report('scrape_timings.json', source_stats, write_time, read_time, total_time, profile, peak_memory)
+    
+    if profiler:
+        print("=" * 60)
+        print("Profile (top 15 by cumulative time)")
+        print("=" * 60)
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+        print(f"Peak memory: {peak_memory / 1024:.1f} KB")
+        print()
+    
     print("Program completed successfully!")
     print()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(profile='--profile' in sys.argv)
\ No newline at end of file